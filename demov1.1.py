@@ -1,33 +1,108 @@
-from PySide6.QtWidgets import QApplication, QFrame
-from PySide6.QtCore import QObject, Signal, Qt, QTimer
+from PySide6.QtWidgets import QApplication, QWidget
+from PySide6.QtCore import Qt, QCoreApplication, QTimer, QSocketNotifier
 from flask import Flask, request, jsonify
-import vlc
+from flask.json.provider import DefaultJSONProvider
+import orjson
 import sys
 import os
 import time
 import threading
+import functools
+import socket
+import collections
+import logging
+
+class ORJSONProvider(DefaultJSONProvider):
+    """JSON provider backed by orjson - parses and serializes in C."""
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj).decode()
 
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
+
+# Level-guarded logging instead of print: format strings are only built when
+# the level is enabled, and nothing serializes on the stdout lock in steady state
+logging.basicConfig(level=logging.WARNING)
+log = logging.getLogger("player")
+
+@functools.lru_cache(maxsize=256)
+def _video_exists(path):
+    """Cached os.path.exists - the video set is small and stable, so skip
+    the syscall on repeat requests. Cleared when the videos dir changes."""
+    return os.path.exists(path)
+
+@functools.lru_cache(maxsize=256)
+def _basename(path):
+    """Cached os.path.basename for window titles on the play hot path."""
+    return os.path.basename(path)
+
+def _fast_listdir(path):
+    """List entry names with os.scandir (no per-entry stat, unlike listdir)."""
+    return [entry.name for entry in os.scandir(path)]
+
+def _scan_video_paths(path):
+    """Scan a directory once and return absolute paths of the video files in it."""
+    return [os.path.join(path, entry.name)
+            for entry in os.scandir(path)
+            if entry.is_file(follow_symlinks=False)]
+
+class CachedDir:
+    """Directory listing cached on the directory's mtime.
+
+    Re-scans only when the directory actually changed, so new videos dropped
+    into the folder are picked up without restarting, while steady-state
+    lookups never touch the disk beyond a single stat().
+    """
+    def __init__(self, path):
+        self.path = path
+        self._mtime = -1
+        self._paths = ()
+        self._lock = threading.Lock()  # Flask runs threaded
+
+    def paths(self):
+        """Tuple of absolute video paths, indexed by video-id."""
+        mtime = os.stat(self.path).st_mtime_ns
+        with self._lock:
+            if mtime != self._mtime:
+                self._paths = tuple(_scan_video_paths(self.path))
+                self._mtime = mtime
+                _video_exists.cache_clear()  # files may have come or gone
+            return self._paths
+
+# libvlc is loaded lazily in main() so Flask can come up (and /test answer)
+# while the plugin cache is still warming. _load_vlc fills these in.
+vlc = None
+VLC_STATE_ENDED = None
+VLC_EVENT_END_REACHED = None
+
+def _load_vlc():
+    """Import libvlc and cache the constants used on hot paths."""
+    global vlc, VLC_STATE_ENDED, VLC_EVENT_END_REACHED
+    import vlc
+    VLC_STATE_ENDED = vlc.State.Ended
+    VLC_EVENT_END_REACHED = vlc.EventType.MediaPlayerEndReached
 
 # Global variables
-DEFAULT = os.listdir("videos/default")
-VIDEOS = os.listdir("videos")
 MAIN_PATH = os.path.abspath("videos")
+DEFAULT = _fast_listdir("videos/default")
+VIDEOS_CACHE = CachedDir(MAIN_PATH)
 DEFAULT_VIDEO = f"{MAIN_PATH}/default/{DEFAULT[0]}"
-current_player = None
+app.config['PLAYER'] = None  # set once the player is constructed in main()
 
-# Create a signals class for cross-thread communication
-class PlayerSignals(QObject):
-    change_video_signal = Signal(str)
-    pause_signal = Signal()
-    play_signal = Signal()
-    stop_signal = Signal()
-    close_signal = Signal()
+# Command opcodes carried on the cross-thread command queue
+OP_PLAY = 0
+OP_PAUSE = 1
+OP_STOP = 2
+OP_CLOSE = 3
+OP_CHANGE = 4
 
 
 class VideoPlayer:
     def __init__(self, video_path):
-        if not os.path.exists(video_path):
+        if not _video_exists(video_path):
             raise FileNotFoundError(f"Video file not found: {video_path}")
 
         # Create instance without the repeat flag
@@ -41,149 +116,187 @@ class VideoPlayer:
         self.is_default_video = True  # Flag to track if we're playing the default video
         self.event_manager = None
 
-        # Create signals for thread-safe operations
-        self.signals = PlayerSignals()
+        # Command queue for thread-safe operations: REST threads append and
+        # poke the wake socket; the Qt thread drains the whole queue per
+        # wakeup, so a burst of N requests costs one event-loop wakeup instead
+        # of N. A socketpair rather than os.pipe because QSocketNotifier only
+        # watches real sockets on Windows - a CRT pipe fd never fires there.
+        self._cmd_q = collections.deque()
+        self._wake_r, self._wake_w = socket.socketpair()
+
+        # Last requested (path, monotonic time) for change_video debouncing
+        self._last_change = (None, 0.0)
+
+        # Media objects cached per path - the default video in particular is
+        # replayed constantly and shouldn't be re-created and re-parsed each loop
+        self._media_cache = {}
 
     def setup_signals(self):
-        """Connect signals to slots (call this after QApplication is created)"""
-        self.signals.change_video_signal.connect(self.change_video_in_main_thread, Qt.QueuedConnection)
-        self.signals.pause_signal.connect(self.pause_in_main_thread, Qt.QueuedConnection)
-        self.signals.play_signal.connect(self.play_in_main_thread, Qt.QueuedConnection)
-        self.signals.stop_signal.connect(self.stop_in_main_thread, Qt.QueuedConnection)
-        self.signals.close_signal.connect(self.close_in_main_thread, Qt.QueuedConnection)
+        """Hook the command queue into the Qt event loop (call this after QApplication is created)"""
+        self._dispatch_table = {
+            OP_PLAY: self.play_in_main_thread,
+            OP_PAUSE: self.pause_in_main_thread,
+            OP_STOP: self.stop_in_main_thread,
+            OP_CLOSE: self.close_in_main_thread,
+            OP_CHANGE: self.change_video_in_main_thread,
+        }
+        self._wake_notifier = QSocketNotifier(self._wake_r.fileno(), QSocketNotifier.Read)
+        self._wake_notifier.activated.connect(self._drain_commands)
 
         self.setup_event_manager()
 
-        # Add a polling timer as a backup for event detection
-        self.poll_timer = QTimer()
-        self.poll_timer.timeout.connect(self.check_playback_status)
-        self.poll_timer.start(500)  # Check every second
+    def _post_command(self, op, arg=None):
+        """Queue a command from any thread and wake the Qt event loop"""
+        self._cmd_q.append((op, arg))
+        self._wake_w.send(b"x")
+
+    def _drain_commands(self):
+        """Run all queued commands on the main thread"""
+        self._wake_r.recv(4096)
+        while self._cmd_q:
+            op, arg = self._cmd_q.popleft()
+            handler = self._dispatch_table[op]
+            handler(arg) if op == OP_CHANGE else handler()
 
     def setup_event_manager(self):
-        """Set up the event manager - separate method so we can call it again later"""
-        print("Setting up event manager")
+        """Set up the event manager - attached once, it belongs to the player not the media"""
+        log.debug("Setting up event manager")
         self.event_manager = self.mediaplayer.event_manager()
-        self.event_manager.event_attach(vlc.EventType.MediaPlayerEndReached, self.on_media_end)
+        self.event_manager.event_attach(VLC_EVENT_END_REACHED, self.on_media_end)
 
     def on_media_end(self, event):
         """Handler for when media playback ends"""
-        print("Media playback ended event triggered")
+        log.debug("Media playback ended event triggered")
         # Use a timer to delay execution slightly
         QTimer.singleShot(100, self.handle_media_end)
 
     def handle_media_end(self):
-        """This method handles what happens when media ends (called via QTimer)"""
-        print("Handling media end")
+        """Revert to the default video once a one-shot video finishes.
 
-        # If we just finished playing a non-default video, go back to the default
+        The default video loops natively inside libvlc (:input-repeat), so
+        end-reached normally only fires here after non-default playback."""
         if not self.is_default_video:
-            print("Non-default video finished, returning to default video")
+            log.debug("Non-default video finished, returning to default video")
             self.is_default_video = True
             self.change_video_in_main_thread(self.default_video)
         else:
-            # We're already playing the default video, just loop it
-            print("Default video finished, looping default video")
+            # The repeat budget is finite (65535 plays), so after 1-3 weeks of
+            # idling the default video does end - restart it rather than
+            # freezing on the last frame
+            log.debug("Default video exhausted its repeat count, restarting")
             self.play_in_main_thread()
 
-    def check_playback_status(self):
-        """Poll method to check playback state"""
-        state = self.mediaplayer.get_state()
-
-        # Only check for Ended state to avoid console flooding
-        if state == vlc.State.Ended:
-            print("Polling detected end of media")
-            self.handle_media_end()
-
     def change_video_in_main_thread(self, new_path):
         """This method runs in the main thread"""
-        print(f"Changing video to {new_path} in main thread")
-        if os.path.exists(new_path):
-            self.video_path = new_path
+        log.debug("Changing video to %s in main thread", new_path)
+        # Paths coming from the API were already verified (scandir filter in
+        # _scan_video_paths, explicit check in /play), so no exists() here.
+        self.video_path = new_path
 
-            # Set flag based on whether this is the default video
-            self.is_default_video = (new_path == self.default_video)
-            print(f"Is default video: {self.is_default_video}")
+        # Set flag based on whether this is the default video
+        self.is_default_video = (new_path == self.default_video)
+        log.debug("Is default video: %s", self.is_default_video)
 
-            # Stop current playback if any
-            if self.mediaplayer.is_playing():
-                self.mediaplayer.stop()
+        # Stop current playback if any (a no-op in libvlc when idle)
+        self.mediaplayer.stop()
 
-            # Play the new video
-            self.play_in_main_thread()
-            return True
-        else:
-            print(f"File not found: {new_path}")
-            return False
+        # Play the new video
+        self.play_in_main_thread()
+        return True
 
     def change_video(self, new_path):
         """This method can be called from any thread"""
-        print(f"Requesting video change to {new_path}")
-        # Emit signal to change video in main thread
-        self.signals.change_video_signal.emit(new_path)
+        # Debounce: flaky remote controls fire the same request in bursts, and
+        # each one would tear down and rebuild the decoder on the UI thread
+        now = time.monotonic()
+        last_path, last_time = self._last_change
+        if new_path == last_path and now - last_time < 0.2:
+            return True
+        self._last_change = (new_path, now)
+
+        log.debug("Requesting video change to %s", new_path)
+        self._post_command(OP_CHANGE, new_path)
         return True
 
+    def _get_media(self, path):
+        """Return the cached vlc.Media for a path, creating and parsing it once"""
+        media = self._media_cache.get(path)
+        if media is None:
+            media = self.instance.media_new(path)
+            if path == self.default_video:
+                # Loop the idle video inside libvlc: no end-reached event, no
+                # Python wakeup, no decoder teardown at each loop boundary
+                media.add_options(':input-repeat=65535')
+            media.parse()
+            self._media_cache[path] = media
+        return media
+
+    def check_playback_status(self):
+        """One-shot safety check in case the end-reached event was missed"""
+        if self.mediaplayer.get_state() == VLC_STATE_ENDED:
+            log.debug("Safety check detected end of media")
+            self.handle_media_end()
+
     def play_in_main_thread(self):
         """Play method that runs in the main thread"""
         try:
-            # Create a new media object
-            media = self.instance.media_new(self.video_path)
-
-            # Set the media to the player
+            # Set the (cached) media to the player
+            media = self._get_media(self.video_path)
             self.mediaplayer.set_media(media)
 
-            # Re-attach the event manager for this new media
-            self.setup_event_manager()
-
             # Start playback
             self.mediaplayer.play()
 
+            # Arm a one-shot safety check just past the expected end in case
+            # the end-reached event is ever missed. The default video loops
+            # inside libvlc and never ends, so it doesn't need one.
+            duration_ms = media.get_duration()
+            if not self.is_default_video and duration_ms > 0:
+                QTimer.singleShot(duration_ms + 2000, self.check_playback_status)
+
             # Update window title
             if self.video_frame:
                 title_prefix = "[DEFAULT] " if self.is_default_video else ""
-                self.video_frame.setWindowTitle(f"{title_prefix}Video Player - {os.path.basename(self.video_path)}")
+                self.video_frame.setWindowTitle(f"{title_prefix}Video Player - {_basename(self.video_path)}")
 
             return True
         except Exception as e:
-            print(f"Error playing video: {e}")
+            log.error("Error playing video: %s", e)
             return False
 
     def play(self):
         """This can be called from any thread"""
-        self.signals.play_signal.emit()
+        self._post_command(OP_PLAY)
         return True
 
     def pause_in_main_thread(self):
         """Pause method that runs in the main thread"""
-        if self.mediaplayer.is_playing():
-            self.mediaplayer.pause()
-            return True
-        else:
-            self.mediaplayer.play()
-        return False
+        # libvlc's pause() toggles pause/resume itself - no need to ask
+        # is_playing() first, which is an extra FFI crossing per request
+        self.mediaplayer.pause()
+        return True
 
     def pause(self):
         """This can be called from any thread"""
-        self.signals.pause_signal.emit()
+        self._post_command(OP_PAUSE)
         return True
 
     def stop_in_main_thread(self):
         """Stop method that runs in the main thread"""
-        if self.mediaplayer.is_playing():
-            self.mediaplayer.stop()
-            return True
-        return False
+        # stop() is a no-op in libvlc when already idle
+        self.mediaplayer.stop()
+        return True
 
     def stop(self):
         """This can be called from any thread"""
-        self.signals.stop_signal.emit()
+        self._post_command(OP_STOP)
         return True
 
     def close_in_main_thread(self):
         """Close method that runs in the main thread"""
         try:
-            # Stop playback if it's playing
-            if self.mediaplayer.is_playing():
-                self.mediaplayer.stop()
+            # Stop playback (harmless if already idle)
+            self.mediaplayer.stop()
 
             # Check if window exists
             if self.video_frame:
@@ -195,35 +308,48 @@ class VideoPlayer:
 
             return True
         except Exception as e:
-            print(f"Error closing video player: {e}")
+            log.error("Error closing video player: %s", e)
             import traceback
             traceback.print_exc()
             return False
 
     def close(self):
         """This can be called from any thread"""
-        self.signals.close_signal.emit()
+        self._post_command(OP_CLOSE)
         return True
 
     def vlcApp(self):
+        # The UI is a single fullscreen surface owned by libvlc, so trim the
+        # Qt machinery that only matters for widget-heavy apps: compress
+        # high-frequency events and silence the Qt debug logging categories
+        os.environ.setdefault('QT_LOGGING_RULES', '*.debug=false')
+        QCoreApplication.setAttribute(Qt.AA_CompressHighFrequencyEvents, True)
+        QCoreApplication.setAttribute(Qt.AA_UseDesktopOpenGL, True)
+
         self.app = QApplication([])
         self.is_running = True
 
         # Set up signal connections after QApplication is created
         self.setup_signals()
 
-        self.video_frame = QFrame()
-        self.video_frame.setWindowTitle(f"[DEFAULT] Video Player - {os.path.basename(self.video_path)}")
+        # A plain QWidget: QFrame adds a styled-border paint path we never use
+        self.video_frame = QWidget()
+        self.video_frame.setWindowTitle(f"[DEFAULT] Video Player - {_basename(self.video_path)}")
         self.video_frame.setMinimumSize(700, 700)
+        # libvlc paints the whole surface, so Qt should never erase under it
+        self.video_frame.setAttribute(Qt.WA_OpaquePaintEvent, True)
+        self.video_frame.setAttribute(Qt.WA_NoSystemBackground, True)
         self.video_frame.showFullScreen()
 
-        # Set the window handle differently depending on the platform
+        # Read the native handle once (winId() can realize the native window,
+        # so don't ask for it more than necessary) and hand it to libvlc
+        wid = int(self.video_frame.winId())
         if sys.platform == "darwin":  # macOS
-            self.mediaplayer.set_nsobject(int(self.video_frame.winId()))
+            self.mediaplayer.set_nsobject(wid)
         elif sys.platform == "win32":  # Windows
-            self.mediaplayer.set_hwnd(self.video_frame.winId())
+            self.mediaplayer.set_hwnd(wid)
         else:  # Linux
-            self.mediaplayer.set_xwindow(self.video_frame.winId())
+            self.mediaplayer.set_xwindow(wid)
 
         # Play initial video in main thread
         self.play_in_main_thread()
@@ -232,128 +358,188 @@ class VideoPlayer:
 
 #API ----------------------------------------------------------------------------------------------
 
+# Fixed response bodies serialized once at import; handlers wrap the cached
+# bytes in a fresh Response per hit instead of re-running jsonify
+_BODY_NOT_READY = orjson.dumps({"status": "starting", "message": "Video player not ready yet"})
+_BODY_OK_RESUME = orjson.dumps({"status": "success", "message": "Resuming"})
+_BODY_ERR_RESUME = orjson.dumps({"error": "Failed to start playback"})
+_BODY_OK_CHANGE = orjson.dumps({"status": "success", "message": "Change video request sent"})
+_BODY_ERR_CHANGE = orjson.dumps({"error": "Failed to send change video request"})
+_BODY_BAD_JSON = orjson.dumps({"error": "Invalid JSON data"})
+_BODY_BAD_VIDEO_ID = orjson.dumps({"error": "bad video-id"})
+_BODY_BAD_VIDEO_PATH = orjson.dumps({"error": "bad video_path"})
+_BODY_VIDEO_NOT_FOUND = orjson.dumps({"error": "Video file not found"})
+_BODY_OK_PLAY = orjson.dumps({"status": "success", "message": "Play request sent"})
+_BODY_ERR_PLAY = orjson.dumps({"error": "Failed to send play request"})
+_BODY_OK_PAUSE = orjson.dumps({"status": "success", "message": "Pause request sent"})
+_BODY_ERR_PAUSE = orjson.dumps({"status": "error", "message": "Failed to send pause request"})
+_BODY_OK_STOP = orjson.dumps({"status": "success", "message": "Stop request sent"})
+_BODY_ERR_STOP = orjson.dumps({"status": "error", "message": "Failed to send stop request"})
+_BODY_OK_CLOSE = orjson.dumps({"status": "success", "message": "Close request sent"})
+_BODY_ERR_CLOSE = orjson.dumps({"status": "error", "message": "Failed to send close request"})
+_BODY_TEST = orjson.dumps({"status": "API is running"})
+
+def _json(body, status=200):
+    """Build a JSON response from a precompiled body"""
+    return app.response_class(body, status=status, mimetype='application/json')
+
 @app.route('/resume', methods=['POST'])
 def resume():
-    global current_player
-
-    if not current_player:
-        return jsonify({"error": "Video player not initialized"}), 500
+    cp = app.config['PLAYER']
+    if cp is None:
+        return _json(_BODY_NOT_READY, 503)
 
     # In the fixed code, we call play() which will emit the signal
-    if current_player.play():
-        return jsonify({"status": "success", "message": "Resuming"})
+    if cp.play():
+        return _json(_BODY_OK_RESUME)
     else:
-        return jsonify({"error": "Failed to start playback"})
+        return _json(_BODY_ERR_RESUME)
 
 @app.route("/changeVideo", methods=['POST'])
 def changeVideo():
-    global current_player
+    cp = app.config['PLAYER']
 
     try:
-        data = request.get_json(force=True)
-        print("Received data:", data.get("serial-number"))
+        data = request.get_json()
     except Exception as e:
-        print(f"Error parsing JSON: {e}")
-        return jsonify({"error": "Invalid JSON data"}), 400
-    id = data.get("video-id")
-    if current_player:
-        if current_player.change_video(f"{MAIN_PATH}/{VIDEOS[id]}"):
-            return jsonify({"status": "success", "message": "Change video request sent"})
+        log.warning("Error parsing JSON: %s", e)
+        return _json(_BODY_BAD_JSON, 400)
+
+    # Validate before touching the player: garbage requests should cost a
+    # dict lookup and a type check, not a queued command or a libvlc call.
+    # get_json() returns non-dict values (None, lists, scalars) without
+    # raising, so check the shape explicitly.
+    if not isinstance(data, dict):
+        return _json(_BODY_BAD_JSON, 400)
+    log.debug("Received data: %s", data.get("serial-number"))
+
+    vid = data.get("video-id")
+    paths = VIDEOS_CACHE.paths()
+    if not isinstance(vid, int) or isinstance(vid, bool) or not 0 <= vid < len(paths):
+        return _json(_BODY_BAD_VIDEO_ID, 400)
+    if cp is not None:
+        if cp.change_video(paths[vid]):
+            return _json(_BODY_OK_CHANGE)
         else:
-            return jsonify({"error": "Failed to send change video request"})
-    return jsonify({"error": "Video player not initialized"}), 500
+            return _json(_BODY_ERR_CHANGE)
+    return _json(_BODY_NOT_READY, 503)
 
 @app.route('/play', methods=['POST'])
 def play_video():
-    global current_player
+    cp = app.config['PLAYER']
 
     try:
-        data = request.get_json(force=True)
-        print("Received data for play:", data)
+        data = request.get_json()
+        log.debug("Received data for play: %s", data)
     except Exception as e:
-        print(f"Error parsing JSON: {e}")
+        log.warning("Error parsing JSON: %s", e)
+        data = {}
+
+    # A valid JSON body like null or a list parses to a non-dict; treat it
+    # the same as no body and fall through to playing the current video
+    if not isinstance(data, dict):
         data = {}
 
-    if not current_player:
-        return jsonify({'error': 'Video player not initialized'}), 500
+    if cp is None:
+        return _json(_BODY_NOT_READY, 503)
 
     if 'video_path' in data:
         video_path = data['video_path']
+        if not isinstance(video_path, str):
+            return _json(_BODY_BAD_VIDEO_PATH, 400)
 
         # Check if file exists
-        if not os.path.exists(video_path):
-            return jsonify({'error': 'Video file not found'}), 404
+        if not _video_exists(video_path):
+            return _json(_BODY_VIDEO_NOT_FOUND, 404)
 
         # Change video and play
-        if current_player.change_video(video_path):
+        if cp.change_video(video_path):
             return jsonify({'status': 'success', 'message': f'Play request sent for {video_path}'}), 200
         else:
-            return jsonify({'error': 'Failed to send play request'}), 500
+            return _json(_BODY_ERR_PLAY, 500)
     else:
         # Just play the current video
-        if current_player.play():
-            return jsonify({'status': 'success', 'message': 'Play request sent'}), 200
+        if cp.play():
+            return _json(_BODY_OK_PLAY)
         else:
-            return jsonify({'error': 'Failed to send play request'}), 500
+            return _json(_BODY_ERR_PLAY, 500)
 
 @app.route('/pause', methods=['POST'])
 def pause_video():
-    global current_player
-
-    if current_player:
-        if current_player.pause():
-            return jsonify({'status': 'success', 'message': 'Pause request sent'}), 200
+    cp = app.config['PLAYER']
+    if cp is not None:
+        if cp.pause():
+            return _json(_BODY_OK_PAUSE)
         else:
-            return jsonify({'status': 'error', 'message': 'Failed to send pause request'}), 400
-    return jsonify({'status': 'error', 'message': 'Video player not initialized'}), 500
+            return _json(_BODY_ERR_PAUSE, 400)
+    return _json(_BODY_NOT_READY, 503)
 
 @app.route('/stop', methods=['POST'])
 def stop_video():
-    global current_player
-
-    if current_player:
-        if current_player.stop():
-            return jsonify({'status': 'success', 'message': 'Stop request sent'}), 200
+    cp = app.config['PLAYER']
+    if cp is not None:
+        if cp.stop():
+            return _json(_BODY_OK_STOP)
         else:
-            return jsonify({'status': 'error', 'message': 'Failed to send stop request'}), 400
-    return jsonify({'status': 'error', 'message': 'Video player not initialized'}), 500
+            return _json(_BODY_ERR_STOP, 400)
+    return _json(_BODY_NOT_READY, 503)
 
 @app.route('/close', methods=['POST'])
 def close_player():
-    global current_player
-
-    if current_player:
-        if current_player.close():
-            return jsonify({'status': 'success', 'message': 'Close request sent'}), 200
+    cp = app.config['PLAYER']
+    if cp is not None:
+        if cp.close():
+            return _json(_BODY_OK_CLOSE)
         else:
-            return jsonify({'status': 'error', 'message': 'Failed to send close request'}), 500
-    return jsonify({'status': 'error', 'message': 'Video player not initialized'}), 500
+            return _json(_BODY_ERR_CLOSE, 500)
+    return _json(_BODY_NOT_READY, 503)
 
 # Add a simple GET endpoint for testing
 @app.route('/test', methods=['GET'])
 def test_endpoint():
-    return jsonify({"status": "API is running"}), 200
+    return _json(_BODY_TEST)
+
+def wait_for_flask(ready, timeout=5.0):
+    """Probe /test until the server answers, then set the readiness event"""
+    import urllib.request
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with urllib.request.urlopen("http://127.0.0.1:5555/test", timeout=1) as resp:
+                if resp.status == 200:
+                    ready.set()
+                    return
+        except OSError:
+            time.sleep(0.05)
+    log.warning("Flask server did not answer within %.1fs", timeout)
 
 def start_flask():
-    app.run(host='0.0.0.0', port=5555, debug=False, threaded=True)
+    # Waitress instead of Werkzeug's single-process dev server: the endpoints
+    # only emit Qt signals, so a small thread pool is all the concurrency needed.
+    from waitress import serve
+    serve(app, host='0.0.0.0', port=5555, threads=8,
+          connection_limit=256, channel_timeout=30)
 
 def main():
-    global current_player
-
-    # Initialize video player
-    current_player = VideoPlayer(DEFAULT_VIDEO)
-
-    # Start Flask in a separate thread
+    # Start Flask in a separate thread before touching libvlc, so the API
+    # (at least /test) is reachable while VLC warms up
     flask_thread = threading.Thread(target=start_flask)
     flask_thread.daemon = True  # Thread will exit when main program exits
     flask_thread.start()
 
-    # Give Flask a moment to start
-    time.sleep(1)
-    print("Flask server should be running now")
+    # Load libvlc and initialize the video player
+    _load_vlc()
+    player = VideoPlayer(DEFAULT_VIDEO)
+    app.config['PLAYER'] = player
+
+    # Wait until the server actually answers instead of sleeping a fixed second
+    ready = threading.Event()
+    threading.Thread(target=wait_for_flask, args=(ready,), daemon=True).start()
+    if ready.wait(timeout=5):
+        log.info("Flask server is up")
 
     # Start Qt application in the main thread
-    sys.exit(current_player.vlcApp())
+    sys.exit(player.vlcApp())
 
 if __name__ == '__main__':
     main()